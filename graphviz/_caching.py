@@ -0,0 +1,108 @@
+"""Memoize layout subprocess results keyed by DOT source and parameters."""
+
+import collections
+import hashlib
+import logging
+import os
+import threading
+import typing
+
+__all__ = ['ENV_MAXSIZE', 'DEFAULT_MAXSIZE',
+           'get_maxsize', 'get_digest', 'make_key',
+           'ResultCache', 'RESULTS']
+
+ENV_MAXSIZE = 'GRAPHVIZ_CACHE_MAXSIZE'
+
+DEFAULT_MAXSIZE = 0
+
+DIGEST_SIZE = 16
+
+IGNORED_KWARGS = frozenset({'quiet'})
+
+
+log = logging.getLogger(__name__)
+
+
+def get_maxsize(environ: typing.Mapping[str, str] = os.environ) -> int:
+    """Return the cache size from the ``GRAPHVIZ_CACHE_MAXSIZE`` environment variable
+        (warn and return ``DEFAULT_MAXSIZE`` for invalid values).
+
+    >>> get_maxsize({})
+    0
+
+    >>> get_maxsize({'GRAPHVIZ_CACHE_MAXSIZE': '128'})
+    128
+    """
+    value = environ.get(ENV_MAXSIZE)
+    if not value:
+        return DEFAULT_MAXSIZE
+
+    try:
+        maxsize = int(value)
+    except ValueError as e:
+        log.warning('ignore invalid %s=%r: %s', ENV_MAXSIZE, value, e)
+        return DEFAULT_MAXSIZE
+    return max(maxsize, 0)
+
+
+def get_digest(data: bytes) -> bytes:
+    """Return the ``DIGEST_SIZE`` bytes BLAKE2 digest of ``data``.
+
+    >>> len(get_digest(b'graph { spam }'))
+    16
+    """
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def make_key(digest: bytes, *args, **kwargs) -> typing.Tuple[typing.Any, ...]:
+    """Return hashable cache key from the source ``digest`` and the given arguments
+        (skipping keyword arguments that do not change the result).
+
+    >>> make_key(b'digest', 'dot', 'svg', renderer=None, quiet=True)
+    (b'digest', ('dot', 'svg'), (('renderer', None),))
+    """
+    kwargs = tuple(sorted((k, v) for k, v in kwargs.items()
+                          if k not in IGNORED_KWARGS))
+    return digest, args, kwargs
+
+
+class ResultCache:
+    """Thread-safe mapping of cache keys to results,
+        discarding least recently used results beyond ``maxsize``."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        """int: Maximal number of results to keep (``0`` disables the cache)."""
+
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: typing.Hashable) -> typing.Any:
+        """Return the result stored under ``key`` or ``None``."""
+        with self._lock:
+            try:
+                self._results.move_to_end(key)
+            except KeyError:
+                return None
+            log.debug('cache hit %r', key)
+            return self._results[key]
+
+    def set(self, key: typing.Hashable, result: typing.Any) -> None:
+        """Store ``result`` under ``key`` dropping least recently used results."""
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        with self._lock:
+            self._results.clear()
+
+
+RESULTS = ResultCache(get_maxsize())
+"""Memoized results of ``.pipe()`` and ``.render()`` calls."""
@@ -0,0 +1,88 @@
+"""Delete transient source files in a background thread."""
+
+import concurrent.futures
+import logging
+import os
+import threading
+import typing
+
+__all__ = ['remove', 'wait', 'flush']
+
+
+log = logging.getLogger(__name__)
+
+
+def _make_executor() -> concurrent.futures.ThreadPoolExecutor:
+    # worker threads are joined (finishing queued removals) at interpreter exit
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                 thread_name_prefix='graphviz-cleanup')
+
+
+_EXECUTOR = _make_executor()
+
+_PENDING: typing.Dict[str, concurrent.futures.Future] = {}
+
+_LOCK = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Start over in a forked child (which does not inherit the worker thread)."""
+    global _EXECUTOR, _PENDING, _LOCK
+    _EXECUTOR = _make_executor()
+    _PENDING = {}
+    _LOCK = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _make_key(filepath: typing.Union[os.PathLike, str]) -> str:
+    return os.path.normcase(os.path.abspath(filepath))
+
+
+def _remove(filepath: typing.Union[os.PathLike, str]) -> None:
+    log.debug('delete %r', filepath)
+    try:
+        os.remove(filepath)
+    except OSError as e:
+        log.warning('cannot delete %r: %r', filepath, e)
+
+
+def remove(filepath: typing.Union[os.PathLike, str]) -> None:
+    """Schedule the deletion of ``filepath`` in the background thread
+        (delete right away if the interpreter is shutting down)."""
+    key = _make_key(filepath)
+    with _LOCK:
+        try:
+            future = _EXECUTOR.submit(_remove, filepath)
+        except RuntimeError:  # interpreter shutdown
+            future = None
+        else:
+            _PENDING[key] = future
+
+    if future is None:
+        _remove(filepath)
+        return
+
+    def discard(done: concurrent.futures.Future) -> None:
+        with _LOCK:
+            if _PENDING.get(key) is done:
+                del _PENDING[key]
+
+    future.add_done_callback(discard)
+
+
+def wait(filepath: typing.Union[os.PathLike, str]) -> None:
+    """Block until a scheduled deletion of ``filepath`` is done."""
+    with _LOCK:
+        future = _PENDING.get(_make_key(filepath))
+    if future is not None:
+        concurrent.futures.wait([future])
+
+
+def flush() -> None:
+    """Block until all scheduled deletions are done."""
+    with _LOCK:
+        futures = list(_PENDING.values())
+    concurrent.futures.wait(futures)
@@ -11,6 +11,8 @@ from .. import _compat
 
 __all__ = ['run_check', 'ExecutableNotFound', 'CalledProcessError']
 
+INPUT_BUFSIZE = 1 << 20  # stdin buffer for writing input_lines
+
 
 log = logging.getLogger(__name__)
 
@@ -96,7 +98,8 @@ def run_check(cmd: typing.Sequence[typing.Union[os.PathLike, str]], *,
 
 
 def _run_input_lines(cmd, input_lines, *, kwargs):
-    popen = subprocess.Popen(cmd, stdin=subprocess.PIPE, **kwargs)
+    popen = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                             bufsize=INPUT_BUFSIZE, **kwargs)
 
     stdin_write = popen.stdin.write
     for line in input_lines:
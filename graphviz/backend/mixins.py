@@ -16,6 +16,8 @@ __all__ = ['Render', 'Pipe', 'Unflatten', 'View']
 class Render(parameters.Parameters):
     """Parameters for calling and calling ``graphviz.render()``."""
 
+    _get_outfile = staticmethod(rendering.get_outfile)
+
     def _get_render_parameters(self,
                                outfile: typing.Union[os.PathLike, str, None] = None,
                                raise_if_result_exists: bool = False,
@@ -45,14 +47,14 @@ class Pipe(parameters.Parameters):
         return [kwargs.pop('engine'), kwargs.pop('format')], kwargs
 
     @property
-    def _pipe_lines(_):  # noqa: N805
-        """Simplify ``._pipe_lines()`` mocking."""
-        return piping.pipe_lines
+    def _pipe(_):  # noqa: N805
+        """Simplify ``._pipe()`` mocking."""
+        return piping.pipe
 
     @property
-    def _pipe_lines_string(_):  # noqa: N805
-        """Simplify ``._pipe_lines_string()`` mocking."""
-        return piping.pipe_lines_string
+    def _pipe_string(_):  # noqa: N805
+        """Simplify ``._pipe_string()`` mocking."""
+        return piping.pipe_string
 
 
 class Unflatten:
@@ -1,5 +1,6 @@
 """Pipe bytes, strings, or string iterators through Graphviz ``dot``."""
 
+import secrets
 import typing
 
 from .. import _tools
@@ -8,7 +9,14 @@ from . import dot_command
 from . import execute
 
 __all__ = ['pipe', 'pipe_string',
-           'pipe_lines', 'pipe_lines_string']
+           'pipe_lines', 'pipe_lines_string',
+           'pipe_batch']
+
+BATCH_FORMATS = {'plain', 'plain-ext'}
+
+PLAIN_STOP = b'stop'
+
+SEPARATOR_PREFIX = 'graphviz_pipe_batch_'
 
 
 @_tools.deprecate_positional_args(supported_number=3)
@@ -211,3 +219,109 @@ def pipe_lines_string(engine: str, format: str, input_lines: typing.Iterator[str
 
     proc = execute.run_check(cmd, capture_output=True, quiet=quiet, **kwargs)
     return proc.stdout
+
+
+def pipe_batch(engine: str, format: str, datas: typing.Sequence[bytes], *,
+               renderer: typing.Optional[str] = None,
+               formatter: typing.Optional[str] = None,
+               neato_no_op: typing.Union[bool, int, None] = None,
+               quiet: bool = False) -> typing.List[bytes]:
+    r"""Return ``datas`` piped through one ``engine`` subprocess into ``format``
+        as list of ``bytes``.
+
+    Args:
+        engine: Layout engine for rendering (``'dot'``, ``'neato'``, ...).
+        format: Output format for rendering (``'plain'`` or ``'plain-ext'``).
+        datas: Binary (encoded) DOT sources to render
+            (each holding any number of graphs).
+        renderer: Output renderer (``'cairo'``, ``'gd'``, ...).
+        formatter: Output formatter (``'cairo'``, ``'gd'``, ...).
+        neato_no_op: Neato layout engine no-op flag.
+        quiet: Suppress ``stderr`` output from the layout subprocess.
+
+    Returns:
+        Binary (encoded) stdout of the layout command
+            divided into one output per source (in the order of ``datas``).
+
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter``
+            are unknown.
+        ValueError: If ``format`` is not ``'plain'`` or ``'plain-ext'``.
+        graphviz.RequiredArgumentError: If ``formatter`` is given
+            but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz ``dot`` executable
+            is not found.
+        graphviz.CalledProcessError: If the returncode (exit status)
+            of the rendering ``dot`` subprocess is non-zero
+            (e.g. for a syntax error in any of the sources).
+        RuntimeError: If the output cannot be divided per source
+            (e.g. for an unterminated ``/*`` comment swallowing the separator).
+
+    Example:
+        >>> doctest_mark_exe()
+        >>> import graphviz
+        >>> graphviz.backend.piping.pipe_batch('dot', 'plain',
+        ...                                    [b'graph { spam }', b'graph { eggs }'])[0][-5:]
+        b'stop\n'
+
+    Note:
+        The sources are concatenated into the stdin of one layout command,
+        each followed by a separator graph with one uniquely named node.
+        The output is divided at the plain output of these separator graphs,
+        so each source gets the output of all its graphs like with ``pipe()``
+        (empty for a source without graphs).
+        The sources must use an ASCII compatible encoding.
+
+    See also:
+        https://www.graphviz.org/doc/info/output.html#d:plain
+    """
+    cmd = dot_command.command(engine, format,
+                              renderer=renderer,
+                              formatter=formatter,
+                              neato_no_op=neato_no_op)
+
+    if format not in BATCH_FORMATS:
+        raise ValueError(f'format must be one of {sorted(BATCH_FORMATS)!r}'
+                         f' (got {format!r})')
+
+    if not datas:  # dot would wait for stdin
+        return []
+
+    separator = f'{SEPARATOR_PREFIX}{secrets.token_hex(8)}'.encode('ascii')
+    separator_graph = b'digraph { ' + separator + b' }\n'
+    kwargs = {'input': b''.join(d + b'\n' + separator_graph for d in datas)}
+
+    proc = execute.run_check(cmd, capture_output=True, quiet=quiet, **kwargs)
+
+    results = list(iterplain_outputs(proc.stdout, separator=separator))
+    if len(results) != len(datas):
+        raise RuntimeError(f'expected {len(datas)} separated plain outputs'
+                           f' (got {len(results)})')
+    return results
+
+
+def iterplain_outputs(stdout: bytes, *, separator: bytes) -> typing.Iterator[bytes]:
+    r"""Yield the outputs before each ``separator`` node graph
+        in concatenated plain format ``stdout``.
+
+    >>> list(iterplain_outputs(b'graph 1 1 1\nstop\n'
+    ...                        b'graph 1 1 1\nnode sep 0.5 0.5\nstop\n'
+    ...                        b'graph 1 1 1\nstop\ngraph 1 2 2\nstop\n'
+    ...                        b'graph 1 1 1\nnode sep 0.5 0.5\nstop\n'
+    ...                        b'graph 1 1 1\nnode sep 0.5 0.5\nstop\n',
+    ...                        separator=b'sep'))
+    [b'graph 1 1 1\nstop\n', b'graph 1 1 1\nstop\ngraph 1 2 2\nstop\n', b'']
+    """
+    separator_line = b'node ' + separator + b' '
+    start = graph_start = end = 0
+    is_separator = False
+    for line in stdout.splitlines(keepends=True):
+        end += len(line)
+        if line.startswith(separator_line):
+            is_separator = True
+        elif line.rstrip() == PLAIN_STOP:
+            if is_separator:
+                yield stdout[start:graph_start]
+                start = end
+                is_separator = False
+            graph_start = end
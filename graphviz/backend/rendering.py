@@ -13,7 +13,7 @@ from .. import parameters
 from . import dot_command
 from . import execute
 
-__all__ = ['get_format', 'get_filepath', 'render']
+__all__ = ['get_format', 'get_filepath', 'render', 'render_batch']
 
 
 def get_format(outfile: pathlib.Path, *, format: typing.Optional[str]) -> str:
@@ -327,3 +327,78 @@ def render(engine: str,
                       capture_output=True)
 
     return os.fspath(outfile)
+
+
+def render_batch(engine: str, format: str,
+                 filepaths: typing.Sequence[typing.Union[os.PathLike, str]], *,
+                 renderer: typing.Optional[str] = None,
+                 formatter: typing.Optional[str] = None,
+                 neato_no_op: typing.Union[bool, int, None] = None,
+                 quiet: bool = False) -> typing.List[str]:
+    """Render files with one ``engine`` subprocess into ``format``
+        and return the result filenames.
+
+    Args:
+        engine: Layout engine for rendering (``'dot'``, ``'neato'``, ...).
+        format: Output format for rendering (``'pdf'``, ``'png'``, ...).
+        filepaths: Paths to the DOT source files to render
+            (all from the same directory).
+        renderer: Output renderer (``'cairo'``, ``'gd'``, ...).
+        formatter: Output formatter (``'cairo'``, ``'gd'``, ...).
+        neato_no_op: Neato layout engine no-op flag.
+        quiet: Suppress ``stderr`` output from the layout subprocess.
+
+    Returns:
+        The (possibly relative) paths of the rendered files
+            (in the order of ``filepaths``).
+
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter``
+            are unknown.
+        ValueError: If ``filepaths`` are not all from the same directory.
+        graphviz.RequiredArgumentError: If ``formatter`` is given
+            but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz ``dot`` executable
+            is not found.
+        graphviz.CalledProcessError: If the returncode (exit status)
+            of the rendering ``dot`` subprocess is non-zero.
+
+    Note:
+        The layout command is started from the directory of ``filepaths``,
+        so that references to external files
+        (e.g. ``[image=images/camelot.png]``)
+        can be given as paths relative to the DOT source files.
+
+    See also:
+        https://www.graphviz.org/doc/info/command.html#-O
+    """
+    filepaths = [_tools.promote_pathlike(f) for f in filepaths]
+
+    parents = {f.parent for f in filepaths}
+    if len(parents) > 1:
+        raise ValueError('filepaths must be from the same directory'
+                         f' (got {sorted(map(os.fspath, parents))!r})')
+
+    outfiles = [get_outfile(f, format=format,
+                            renderer=renderer,
+                            formatter=formatter) for f in filepaths]
+
+    cmd = dot_command.command(engine, format,
+                              renderer=renderer,
+                              formatter=formatter,
+                              neato_no_op=neato_no_op)
+
+    if not filepaths:  # dot would read from stdin
+        return []
+
+    parent, = parents
+
+    # https://www.graphviz.org/doc/info/command.html#-O
+    cmd += ['-O'] + [f.name for f in filepaths]
+
+    execute.run_check(cmd,
+                      cwd=parent if parent.parts else None,
+                      quiet=quiet,
+                      capture_output=True)
+
+    return [os.fspath(o) for o in outfiles]
@@ -2,6 +2,7 @@
 
 import typing
 
+from . import _caching
 from . import copying
 
 __all__ = ['Base']
@@ -30,3 +31,12 @@ class Base(LineIterable, copying.CopyBase):
     def __str__(self) -> str:
         """The DOT source code as string."""
         return self.source
+
+    def __bytes__(self) -> bytes:
+        """The DOT source code encoded with ``.encoding``."""
+        return self.source.encode(self.encoding)
+
+    @property
+    def _source_digest(self) -> bytes:
+        """Digest of the DOT source encoded with ``.encoding`` (memoization key)."""
+        return _caching.get_digest(bytes(self))
@@ -17,6 +17,8 @@ class Encoding(copying.CopyBase):
 
     _encoding = DEFAULT_ENCODING
 
+    _codec_info = codecs.lookup(DEFAULT_ENCODING)
+
     def __init__(self, *, encoding: typing.Optional[str] = DEFAULT_ENCODING,
                  **kwargs) -> None:
         super().__init__(**kwargs)
@@ -37,5 +39,5 @@ class Encoding(copying.CopyBase):
         if encoding is None:
             encoding = locale.getpreferredencoding()
 
-        codecs.lookup(encoding)  # raise early
+        self._codec_info = codecs.lookup(encoding)  # raise early
         self._encoding = encoding
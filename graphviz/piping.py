@@ -4,6 +4,7 @@ import codecs
 import logging
 import typing
 
+from . import _caching
 from . import _tools
 from . import backend
 from . import exceptions
@@ -141,14 +142,114 @@ class Pipe(encoding.Encoding, base.Base, backend.Pipe):
                                                  quiet=quiet,
                                                  verify=True)
 
-        args.append(iter(self))
+        if not _caching.RESULTS.maxsize:
+            return self._pipe_source(args, kwargs, encoding=encoding)
 
+        cache_key = _caching.make_key(self._source_digest,
+                                      'pipe', *args,
+                                      input_encoding=self.encoding,
+                                      encoding=encoding, **kwargs)
+        result = _caching.RESULTS.get(cache_key)
+        if result is None:
+            result = self._pipe_source(args, kwargs, encoding=encoding)
+            _caching.RESULTS.set(cache_key, result)
+        return result
+
+    @classmethod
+    def pipe_batch(cls, items: typing.Iterable['Pipe'], *,
+                   format: str = 'plain',
+                   renderer: typing.Optional[str] = None,
+                   formatter: typing.Optional[str] = None,
+                   neato_no_op: typing.Union[bool, int, None] = None,
+                   quiet: bool = False,
+                   encoding: typing.Optional[str] = None,
+                   batch_size: int = 64) -> typing.List[typing.Union[bytes, str]]:
+        """Return the sources of ``items`` piped through the Graphviz layout command
+            with one layout subprocess per ``batch_size`` sources.
+
+        Args:
+            items: Instances to pipe.
+            format: The plain output format used for rendering
+                (``'plain'`` or ``'plain-ext'``).
+            renderer: The output renderer used for rendering
+                (``'cairo'``, ``'gd'``, ...).
+            formatter: The output formatter used for rendering
+                (``'cairo'``, ``'gd'``, ...).
+            neato_no_op: Neato layout engine no-op flag.
+            quiet (bool): Suppress ``stderr`` output
+                from the layout subprocesses.
+            encoding: Encoding for decoding the stdout.
+            batch_size: Maximal number of sources per layout subprocess.
+
+        Returns:
+            Bytes or if encoding is given decoded strings
+                (stdout of the layout commands in the order of ``items``).
+
+        Raises:
+            ValueError: If ``format`` is not ``'plain'`` or ``'plain-ext'``.
+            ValueError: If ``engine``, ``renderer``, or ``formatter``
+                are unknown.
+            graphviz.RequiredArgumentError: If ``formatter`` is given
+                but ``renderer`` is None.
+            graphviz.ExecutableNotFound: If the Graphviz ``dot`` executable
+                is not found.
+            graphviz.CalledProcessError: If the returncode (exit status)
+                of a rendering ``dot`` subprocess is non-zero.
+
+        Example:
+            >>> doctest_mark_exe()
+            >>> import graphviz
+            >>> sources = [graphviz.Source(s) for s in ('graph { spam }', 'graph { eggs }')]
+            >>> [r.splitlines()[-1] for r in graphviz.Source.pipe_batch(sources, encoding='ascii')]
+            ['stop', 'stop']
+
+        Note:
+            Items are grouped by their ``engine``, ``renderer``,
+            ``formatter``, and ``encoding``.
+            Each item gets the output of all its graphs like with ``.pipe()``
+            (the batch output is divided at separator graphs between the items).
+            Use ``.pipe()`` for the other output formats,
+            which do not allow dividing the output of multiple graphs.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be positive: {batch_size!r}')
+
+        groups = {}
+        for index, item in enumerate(items):
+            kwargs = item._get_parameters(format=format,
+                                          renderer=renderer,
+                                          formatter=formatter,
+                                          verify=True)
+            key = (kwargs['engine'], kwargs['format'],
+                   kwargs['renderer'], kwargs['formatter'],
+                   item.encoding)
+            groups.setdefault(key, []).append((index, bytes(item)))
+
+        results = {}
+        for (engine, format_, renderer_, formatter_, _), group in groups.items():
+            for start in range(0, len(group), batch_size):
+                batch = group[start:start + batch_size]
+                indexes, datas = zip(*batch)
+                log.debug('pipe batch of %d sources', len(datas))
+                outputs = backend.piping.pipe_batch(engine, format_, datas,
+                                                    renderer=renderer_,
+                                                    formatter=formatter_,
+                                                    neato_no_op=neato_no_op,
+                                                    quiet=quiet)
+                if encoding is not None:
+                    outputs = [o.decode(encoding) for o in outputs]
+                results.update(zip(indexes, outputs))
+
+        return [results[index] for index in sorted(results)]
+
+    def _pipe_source(self, args, kwargs, *,
+                     encoding: typing.Optional[str]) -> typing.Union[bytes, str]:
         if encoding is not None:
-            if codecs.lookup(encoding) is codecs.lookup(self.encoding):
+            if codecs.lookup(encoding) is self._codec_info:
                 # common case: both stdin and stdout need the same encoding
-                return self._pipe_lines_string(*args, encoding=encoding, **kwargs)
+                return self._pipe_string(*args, self.source, encoding=encoding, **kwargs)
             try:
-                raw = self._pipe_lines(*args, input_encoding=self.encoding, **kwargs)
+                raw = self._pipe(*args, bytes(self), **kwargs)
             except exceptions.CalledProcessError as e:
                 *args, output, stderr = e.args
                 if output is not None:
@@ -158,4 +259,4 @@ class Pipe(encoding.Encoding, base.Base, backend.Pipe):
                 raise e.__class__(*args, output=output, stderr=stderr)
             else:
                 return raw.decode(encoding)
-        return self._pipe_lines(*args, input_encoding=self.encoding, **kwargs)
+        return self._pipe(*args, bytes(self), **kwargs)
@@ -3,18 +3,47 @@
 import logging
 import os
 import pathlib
+import tempfile
 import typing
 
+from . import _caching
+from . import _cleanup
 from . import _tools
 from . import backend
+from . import exceptions
 from . import saving
 
 __all__ = ['Render']
 
+ENV_TMPDIR = 'GRAPHVIZ_TMPDIR'
+
 
 log = logging.getLogger(__name__)
 
 
+def get_tmpdir(environ: typing.Mapping[str, str] = os.environ
+               ) -> typing.Optional[str]:
+    """Return the directory for transient source files
+        from the ``GRAPHVIZ_TMPDIR`` environment variable (or ``None``).
+
+    >>> get_tmpdir({}) is None
+    True
+
+    >>> get_tmpdir({'GRAPHVIZ_TMPDIR': '/dev/shm'})
+    '/dev/shm'
+    """
+    return environ.get(ENV_TMPDIR) or None
+
+
+def _get_file_digest(filepath: typing.Union[os.PathLike, str]) -> typing.Optional[bytes]:
+    """Return the digest of the ``filepath`` content (``None`` if it does not exist)."""
+    try:
+        data = pathlib.Path(filepath).read_bytes()
+    except FileNotFoundError:
+        return None
+    return _caching.get_digest(data)
+
+
 class Render(saving.Save, backend.Render, backend.View):
     """Write source lines to file and render with Graphviz."""
 
@@ -43,7 +72,8 @@ class Render(saving.Save, backend.Render, backend.View):
             view (bool): Open the rendered result
                 with the default application.
             cleanup (bool): Delete the source file
-                after successful rendering.
+                after successful rendering (in a background thread,
+                deletion errors are only logged as warnings).
             format: The output format used for rendering
                 (``'pdf'``, ``'png'``, etc.).
             renderer: The output renderer used for rendering
@@ -94,6 +124,14 @@ class Render(saving.Save, backend.Render, backend.View):
             so that references to external files
             (e.g. ``[image=images/camelot.png]``)
             can be given as paths relative to the DOT source file.
+
+        Note:
+            If the ``GRAPHVIZ_TMPDIR`` environment variable is set
+            (e.g. to ``/dev/shm``), ``cleanup=True`` is given,
+            and neither ``filename`` nor ``directory`` are given,
+            the source is saved to a temporary file in that directory
+            (rendering into the same result file).
+            References to external files are then relative to that directory.
         """
         outfile = _tools.promote_pathlike(outfile)
         if outfile is not None:
@@ -112,24 +150,180 @@ class Render(saving.Save, backend.Render, backend.View):
                                                    overwrite_source=overwrite_source,
                                                    verify=True)
 
+        tmpdir = (get_tmpdir() if cleanup and filename is None and directory is None
+                  else None)
+
         if outfile is not None and filename is None:
             filename = self._get_filepath(outfile)
 
-        filepath = self.save(filename, directory=directory, skip_existing=None)
+        if tmpdir is not None:
+            if filename is not None:  # derived from outfile (like .save(filename))
+                self.filename = filename
+            if outfile is None:
+                _, format = args
+                outfile = self._get_outfile(self.filepath, format=format,
+                                            renderer=kwargs['renderer'],
+                                            formatter=kwargs['formatter'])
+                kwargs['outfile'] = outfile
+            self._mkdirs(outfile)
+            filepath = self._save_transient(tmpdir)
+        else:
+            filepath = self.save(filename, directory=directory, skip_existing=None)
 
         args.append(filepath)
 
-        rendered = self._render(*args, **kwargs)
+        try:
+            if _caching.RESULTS.maxsize:
+                rendered = self._render_memoized(*args, **kwargs)
+            else:
+                rendered = self._render(*args, **kwargs)
+        except Exception:
+            if tmpdir is not None:
+                os.remove(filepath)
+            raise
 
         if cleanup:
-            log.debug('delete %r', filepath)
-            os.remove(filepath)
+            _cleanup.remove(filepath)
 
         if quiet_view or view:
             self._view(rendered, format=self._format, quiet=quiet_view)
 
         return rendered
 
+    def _save_transient(self, directory: typing.Union[os.PathLike, str]) -> str:
+        """Save the DOT source to a new temporary file in ``directory``.
+
+        Returns:
+            The path of the saved source file.
+        """
+        fd, filepath = tempfile.mkstemp(suffix=f'.{self._default_extension}',
+                                        dir=directory)
+        log.debug('write transient source to %r', filepath)
+        with open(fd, 'wb') as f:
+            f.write(bytes(self))
+        return filepath
+
+    @classmethod
+    def render_batch(cls, items: typing.Iterable['Render'], *,
+                     format: typing.Optional[str] = None,
+                     renderer: typing.Optional[str] = None,
+                     formatter: typing.Optional[str] = None,
+                     neato_no_op: typing.Union[bool, int, None] = None,
+                     quiet: bool = False,
+                     batch_size: int = 64) -> typing.List[str]:
+        r"""Save the sources of ``items`` to file and render them
+            with one Graphviz layout subprocess per ``batch_size`` files.
+
+        Args:
+            items: Instances to save and render.
+            format: The output format used for rendering
+                (``'pdf'``, ``'png'``, etc.).
+            renderer: The output renderer used for rendering
+                (``'cairo'``, ``'gd'``, ...).
+            formatter: The output formatter used for rendering
+                (``'cairo'``, ``'gd'``, ...).
+            neato_no_op: Neato layout engine no-op flag.
+            quiet (bool): Suppress ``stderr`` output
+                from the layout subprocesses.
+            batch_size: Maximal number of files per layout subprocess.
+
+        Returns:
+            The (possibly relative) paths of the rendered files
+                (in the order of ``items``).
+
+        Raises:
+            ValueError: If ``format``, ``renderer``, or ``formatter``
+                are unknown.
+            graphviz.RequiredArgumentError: If ``formatter`` is given
+                but ``renderer`` is None.
+            graphviz.ExecutableNotFound: If the Graphviz ``dot`` executable
+                is not found.
+            graphviz.CalledProcessError: If the returncode (exit status)
+                of a rendering ``dot`` subprocess is non-zero.
+
+        Example:
+            >>> doctest_mark_exe()
+            >>> import graphviz
+            >>> graphs = [graphviz.Graph(name=name, directory='doctest-output')
+            ...           for name in ('spam', 'eggs')]
+            >>> [r.replace('\\', '/') for r in graphviz.Graph.render_batch(graphs)]
+            ['doctest-output/spam.gv.pdf', 'doctest-output/eggs.gv.pdf']
+
+        Note:
+            Items are grouped by their ``engine``, ``format``,
+            ``renderer``, ``formatter``, and source file directory.
+            Each layout command is started from the directory of its files.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be positive: {batch_size!r}')
+
+        groups = {}
+        for index, item in enumerate(items):
+            kwargs = item._get_parameters(format=format,
+                                          renderer=renderer,
+                                          formatter=formatter,
+                                          verify=True)
+            filepath = item.save(skip_existing=None)
+            key = (kwargs['engine'], kwargs['format'],
+                   kwargs['renderer'], kwargs['formatter'],
+                   os.path.dirname(filepath))
+            groups.setdefault(key, []).append((index, filepath))
+
+        rendered = {}
+        for (engine, format_, renderer_, formatter_, _), group in groups.items():
+            for start in range(0, len(group), batch_size):
+                batch = group[start:start + batch_size]
+                indexes, filepaths = zip(*batch)
+                log.debug('render batch of %d files', len(filepaths))
+                results = backend.rendering.render_batch(engine, format_, filepaths,
+                                                         renderer=renderer_,
+                                                         formatter=formatter_,
+                                                         neato_no_op=neato_no_op,
+                                                         quiet=quiet)
+                rendered.update(zip(indexes, results))
+
+        return [rendered[index] for index in sorted(rendered)]
+
+    def _render_memoized(self, *args, raise_if_result_exists: bool, **kwargs) -> str:
+        """Return ``._render()`` result path, skip rendering if the memoized
+            result file is still present and unchanged."""
+        *params, _ = args  # key by .filepath instead of a GRAPHVIZ_TMPDIR transient file
+        cache_key = _caching.make_key(self._source_digest,
+                                      'render', *params, self.filepath,
+                                      encoding=self.encoding, **kwargs)
+        cached = _caching.RESULTS.get(cache_key)
+        if cached is not None:
+            rendered, digest = cached
+            if _get_file_digest(rendered) == digest:
+                if raise_if_result_exists:
+                    raise exceptions.FileExistsError(f'output file exists: {rendered!r}')
+                log.debug('skip rendering unchanged memoized result %r', rendered)
+                return rendered
+
+        rendered = self._render(*args,
+                                raise_if_result_exists=raise_if_result_exists,
+                                **kwargs)
+        _caching.RESULTS.set(cache_key, (rendered, _get_file_digest(rendered)))
+        return rendered
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Discard all memoized ``.pipe()`` and ``.render()`` results.
+
+        Note:
+            Memoization is disabled by default. Set the
+            ``GRAPHVIZ_CACHE_MAXSIZE`` environment variable
+            to the maximal number of results to keep to enable it.
+            Memoized results are keyed by source and rendering parameters:
+            changes to files referenced by the source
+            (e.g. ``[image=images/camelot.png]``) are not detected.
+            ``.pipe()`` results are kept in memory,
+            ``.render()`` results only as path and digest of the output file:
+            rendering is skipped while that file exists unchanged
+            (and repeated if it was deleted or modified).
+        """
+        _caching.RESULTS.clear()
+
     def _view(self, filepath: typing.Union[os.PathLike, str], *,
               format: str, quiet: bool) -> None:
         """Start the right viewer based on file format and platform."""
@@ -162,7 +356,8 @@ class Render(saving.Save, backend.Render, backend.View):
             filename: Filename for saving the source
                 (defaults to ``name`` + ``'.gv'``).
             directory: (Sub)directory for source saving and rendering.
-            cleanup (bool): Delete the source file after successful rendering.
+            cleanup (bool): Delete the source file after successful rendering
+                (in a background thread, deletion errors are only logged as warnings).
             quiet (bool): Suppress ``stderr`` output from the layout subprocess.
             quiet_view (bool): Suppress ``stderr`` output
                 from the viewer process (ineffective on Windows).
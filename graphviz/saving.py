@@ -4,6 +4,7 @@ import logging
 import os
 import typing
 
+from . import _cleanup
 from . import _defaults
 from . import _tools
 from . import base
@@ -70,6 +71,7 @@ class Save(encoding.Encoding, base.Base):
             self.directory = directory
 
         filepath = self.filepath
+        _cleanup.wait(filepath)  # pending .render(cleanup=True)
         if skip_existing and os.path.exists(filepath):
             return filepath
 
@@ -6,6 +6,7 @@ import os
 import typing
 
 from .encoding import DEFAULT_ENCODING
+from . import _caching
 from . import _tools
 from . import saving
 from . import jupyter_integration
@@ -118,6 +119,25 @@ class Source(rendering.Render, saving.Save,
             source += '\n'
         return source
 
+    def __bytes__(self) -> bytes:
+        """The DOT source code encoded with ``.encoding`` (encoded once per ``.encoding``)."""
+        encoding, data = self.__dict__.get('_encoded_source', (None, None))
+        if encoding != self.encoding:
+            encoding = self.encoding
+            data = self.source.encode(encoding)
+            self._encoded_source = encoding, data
+        return data
+
+    @property
+    def _source_digest(self) -> bytes:
+        """Digest of the encoded DOT source (computed once per ``.encoding``)."""
+        encoding, digest = self.__dict__.get('_encoded_digest', (None, None))
+        if encoding != self.encoding:
+            encoding = self.encoding
+            digest = _caching.get_digest(bytes(self))
+            self._encoded_digest = encoding, digest
+        return digest
+
     @_tools.deprecate_positional_args(supported_number=2)
     def save(self, filename: typing.Union[os.PathLike, str, None] = None,
              directory: typing.Union[os.PathLike, str, None] = None, *,
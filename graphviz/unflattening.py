@@ -45,19 +45,17 @@ class Unflatten(encoding.Encoding, base.Base, backend.Unflatten):
             Upstream documentation:
             https://www.graphviz.org/pdf/unflatten.1.pdf
         """
-        from . import sources
-
         out = self._unflatten(self.source,
                               stagger=stagger, fanout=fanout, chain=chain,
                               encoding=self.encoding)
 
         kwargs = self._copy_kwargs()
-        return sources.Source(out,
-                              filename=kwargs.get('filename'),
-                              directory=kwargs.get('directory'),
-                              format=kwargs.get('format'),
-                              engine=kwargs.get('engine'),
-                              encoding=kwargs.get('encoding'),
-                              renderer=kwargs.get('renderer'),
-                              formatter=kwargs.get('formatter'),
-                              loaded_from_path=None)
+        return graphviz.Source(out,
+                               filename=kwargs.get('filename'),
+                               directory=kwargs.get('directory'),
+                               format=kwargs.get('format'),
+                               engine=kwargs.get('engine'),
+                               encoding=kwargs.get('encoding'),
+                               renderer=kwargs.get('renderer'),
+                               formatter=kwargs.get('formatter'),
+                               loaded_from_path=None)
@@ -76,6 +76,7 @@ def test_run_check_input_lines_mocked(mocker, sentinel, mock_popen,
 
     mock_popen.assert_called_once_with(_common.INVALID_CMD,
                                        stdin=subprocess.PIPE,
+                                       bufsize=execute.INPUT_BUFSIZE,
                                        stdout=subprocess.PIPE,
                                        stderr=subprocess.PIPE,
                                        startupinfo=_common.StartupinfoMatcher())
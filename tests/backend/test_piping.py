@@ -138,6 +138,7 @@ def test_pipe_lines_mocked(capsys, mock_popen, quiet,
     mock_popen.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
                                         '-Kdot', '-Tpng'],
                                        stdin=subprocess.PIPE,
+                                       bufsize=graphviz.backend.execute.INPUT_BUFSIZE,
                                        stdout=subprocess.PIPE,
                                        stderr=subprocess.PIPE,
                                        startupinfo=_common.StartupinfoMatcher())
@@ -164,7 +165,68 @@ def test_pipe_lines_string_mocked(capsys, mock_popen, quiet,
                                         '-Kdot', '-Tpng'],
                                        encoding=encoding,
                                        stdin=subprocess.PIPE,
+                                       bufsize=graphviz.backend.execute.INPUT_BUFSIZE,
                                        stdout=subprocess.PIPE,
                                        stderr=subprocess.PIPE,
                                        startupinfo=_common.StartupinfoMatcher())
     assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+SEPARATOR_OUTPUT = b'graph 1 1 1\nnode graphviz_pipe_batch_sep 0.5 0.5\nstop\n'
+
+
+def test_pipe_batch_mocked(capsys, mocker, mock_run, quiet):
+    mocker.patch('secrets.token_hex', autospec=True, return_value='sep')
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout=(b'graph 1 1 1\nstop\n'
+                                                                + SEPARATOR_OUTPUT
+                                                                + SEPARATOR_OUTPUT
+                                                                + b'graph 1 2 2\nstop\n'
+                                                                + b'graph 1 3 3\nstop\n'
+                                                                + SEPARATOR_OUTPUT),
+                                                        stderr=b'stderr')
+
+    datas = [b'graph { spam }', b'// no graph', b'graph { eggs } graph { ham }']
+    assert graphviz.backend.piping.pipe_batch('dot', 'plain', datas,
+                                              quiet=quiet) == [b'graph 1 1 1\nstop\n',
+                                                               b'',
+                                                               (b'graph 1 2 2\nstop\n'
+                                                                b'graph 1 3 3\nstop\n')]
+
+    separator_graph = b'digraph { graphviz_pipe_batch_sep }\n'
+    mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
+                                      '-Kdot', '-Tplain'],
+                                     input=b''.join(d + b'\n' + separator_graph
+                                                    for d in datas),
+                                     capture_output=True,
+                                     startupinfo=_common.StartupinfoMatcher())
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_pipe_batch_empty_mocked(mock_run):
+    assert graphviz.backend.piping.pipe_batch('dot', 'plain-ext', []) == []
+
+    mock_run.assert_not_called()
+
+
+def test_pipe_batch_invalid_format(mock_run):
+    with pytest.raises(ValueError, match=r'format must be one of'):
+        graphviz.backend.piping.pipe_batch('dot', 'svg', [b'graph { spam }'])
+
+    mock_run.assert_not_called()
+
+
+def test_pipe_batch_missing_separator_mocked(mocker, mock_run):
+    mocker.patch('secrets.token_hex', autospec=True, return_value='sep')
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout=(b'graph 1 1 1\nstop\n'
+                                                                + SEPARATOR_OUTPUT
+                                                                + b'graph 1 2 2\nstop\n'),
+                                                        stderr=b'')
+
+    with pytest.raises(RuntimeError,
+                       match=r'expected 2 separated plain outputs \(got 1\)'):
+        graphviz.backend.piping.pipe_batch('dot', 'plain',
+                                           [b'graph { spam }', b'graph { eggs }'])
@@ -160,6 +160,43 @@ def test_render_raises_mocked(tmp_path, mock_run, args, kwargs,
             graphviz.render(*args, **kwargs)
 
 
+@pytest.mark.parametrize(
+    'directory', [None, 'dot_sources'])
+def test_render_batch_mocked(capsys, mock_run, quiet, directory,
+                             filenames=('spam.gv', 'eggs.gv')):
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout='stdout',
+                                                        stderr='stderr')
+
+    filepaths = [os.path.join(directory, f) if directory is not None else f
+                 for f in filenames]
+
+    result = rendering.render_batch('dot', 'svg', filepaths,
+                                    renderer='cairo', quiet=quiet)
+
+    assert result == [f'{f}.cairo.svg' for f in filepaths]
+
+    mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
+                                      '-Kdot', '-Tsvg:cairo',
+                                      '-O', *filenames],
+                                     capture_output=True,
+                                     cwd=_tools.promote_pathlike(directory),
+                                     startupinfo=_common.StartupinfoMatcher())
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_render_batch_empty_mocked(mock_run):
+    assert rendering.render_batch('dot', 'pdf', []) == []
+    mock_run.assert_not_called()
+
+
+def test_render_batch_different_directories_raises(mock_run):
+    with pytest.raises(ValueError, match=r'same directory'):
+        rendering.render_batch('dot', 'pdf', ['spam.gv', 'eggs/eggs.gv'])
+    mock_run.assert_not_called()
+
+
 @pytest.mark.parametrize(
     'filepath,  kwargs, expected_fspath',
     [('spam.gv', {'format': 'pdf'}, 'spam.gv.pdf'),
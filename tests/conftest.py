@@ -67,11 +67,26 @@ def mock_render(mocker):
     yield mocker.patch('graphviz.backend.rendering.render', autospec=True)
 
 
+@pytest.fixture
+def mock_render_batch(mocker):
+    yield mocker.patch('graphviz.backend.rendering.render_batch', autospec=True)
+
+
 @pytest.fixture
 def mock_pipe(mocker):
     yield mocker.patch('graphviz.backend.piping.pipe', autospec=True)
 
 
+@pytest.fixture
+def mock_pipe_batch(mocker):
+    yield mocker.patch('graphviz.backend.piping.pipe_batch', autospec=True)
+
+
+@pytest.fixture
+def mock_pipe_string(mocker):
+    yield mocker.patch('graphviz.backend.piping.pipe_string', autospec=True)
+
+
 @pytest.fixture
 def mock_pipe_lines(mocker):
     yield mocker.patch('graphviz.backend.piping.pipe_lines', autospec=True)
@@ -98,3 +113,12 @@ def mock_platform(monkeypatch, request):
 def unknown_platform(monkeypatch, name='nonplatform'):
     monkeypatch.setattr('graphviz.backend.viewing.PLATFORM', name)
     yield name
+
+
+@pytest.fixture
+def memoize(monkeypatch, maxsize=8):
+    from graphviz import _caching
+
+    results = _caching.ResultCache(maxsize)
+    monkeypatch.setattr('graphviz._caching.RESULTS', results)
+    yield results
@@ -1,3 +1,4 @@
+import codecs
 import locale
 import pathlib
 import re
@@ -47,6 +48,10 @@ def test_str(dot):
     assert str(dot) == dot.source
 
 
+def test_bytes(dot):
+    assert bytes(dot) == dot.source.encode(dot.encoding)
+
+
 @pytest.mark.parametrize(
     'parameter, expected_exception, match',
     [('engine', ValueError, r'unknown engine'),
@@ -122,6 +127,7 @@ def test_render_mocked(mocker, mock_render, dot):
                                         raise_if_result_exists=False,
                                         overwrite_filepath=False,
                                         quiet=False)
+    graphviz._cleanup.flush()
     mock_remove.assert_called_once_with(mock_save.return_value)
     mock_view.assert_called_once_with(mock_render.return_value,
                                       format=dot.format, quiet=False)
@@ -150,6 +156,7 @@ def test_render_outfile_mocked(mocker, mock_render, dot):
                                         raise_if_result_exists=True,
                                         overwrite_filepath=True,
                                         quiet=False)
+    graphviz._cleanup.flush()
     mock_remove.assert_called_once_with(mock_save.return_value)
     mock_view.assert_called_once_with(mock_render.return_value,
                                       format=dot.format, quiet=False)
@@ -225,64 +232,77 @@ def test_save_mocked(mocker, dot, filename='nonfilename', directory='nondirector
 
 @pytest.mark.parametrize(
     'encoding', [None, 'ascii', 'utf-8'])
-def test_pipe_mocked(mocker, mock_pipe_lines, mock_pipe_lines_string, quiet,
-                     dot, encoding):
+def test_pipe_mocked(mock_pipe, mock_pipe_string, quiet, dot, encoding):
     input_encoding = 'utf-8'
     dot.encoding = input_encoding
 
     result = dot.pipe(encoding=encoding, quiet=quiet)
 
-    expected_args = ['dot', 'pdf', mocker.ANY]
+    expected_args = ['dot', 'pdf']
     expected_kwargs = {'quiet': quiet,
                        'renderer': None,
                        'formatter': None,
                        'neato_no_op': None}
 
     if encoding == input_encoding:
-        assert result is mock_pipe_lines_string.return_value
-        mock_pipe_lines_string.assert_called_once_with(*expected_args,
-                                                       encoding=encoding,
-                                                       **expected_kwargs)
+        assert result is mock_pipe_string.return_value
+        mock_pipe_string.assert_called_once_with(*expected_args, dot.source,
+                                                 encoding=encoding,
+                                                 **expected_kwargs)
+        mock_pipe.assert_not_called()
         return
 
     if encoding is None:
-        assert result is mock_pipe_lines.return_value
+        assert result is mock_pipe.return_value
     else:
-        assert result is mock_pipe_lines.return_value.decode.return_value
-        mock_pipe_lines.return_value.decode.assert_called_once_with(encoding)
-    mock_pipe_lines.assert_called_once_with(*expected_args,
-                                            input_encoding=input_encoding,
-                                            **expected_kwargs)
+        assert result is mock_pipe.return_value.decode.return_value
+        mock_pipe.return_value.decode.assert_called_once_with(encoding)
+    mock_pipe.assert_called_once_with(*expected_args,
+                                      dot.source.encode(input_encoding),
+                                      **expected_kwargs)
+    mock_pipe_string.assert_not_called()
 
 
-def test_pipe_lines_mocked(mocker, mock_pipe_lines, dot, format_='svg'):
+def test_pipe_data_mocked(mock_pipe, dot, format_='svg'):
     assert dot.format != format_
 
-    assert dot.pipe(format=format_) is mock_pipe_lines.return_value
+    assert dot.pipe(format=format_) is mock_pipe.return_value
+
+    mock_pipe.assert_called_once_with(dot.engine, format_,
+                                      dot.source.encode('utf-8'),
+                                      renderer=None, formatter=None,
+                                      neato_no_op=None,
+                                      quiet=False)
+    _, _, data = mock_pipe.call_args.args
+    assert isinstance(data, bytes)
+    assert data.decode('utf-8').splitlines(keepends=True) == list(dot)
+
+
+@pytest.mark.parametrize(
+    'format_', ['canon', 'dot', 'gv', 'xdot', 'plain'])
+def test_pipe_text_format_runs_layout_mocked(mock_pipe, dot, format_):
+    assert dot.pipe(format=format_) is mock_pipe.return_value
 
-    mock_pipe_lines.assert_called_once_with(dot.engine, format_, mocker.ANY,
-                                            renderer=None, formatter=None,
-                                            neato_no_op=None,
-                                            input_encoding='utf-8',
-                                            quiet=False)
-    _, _, data = mock_pipe_lines.call_args.args
-    expected_lines = dot.source.splitlines(keepends=True)
-    assert list(data) == expected_lines
+    mock_pipe.assert_called_once_with(dot.engine, format_,
+                                      dot.source.encode(dot.encoding),
+                                      renderer=None, formatter=None,
+                                      neato_no_op=None,
+                                      quiet=False)
 
 
 @pytest.mark.exe
-def test_pipe_lines_called_process_error(invalid_dot, encoding='ascii',
-                                         input_encoding='utf-8'):
-    _test_pipe_lines_called_process_error(invalid_dot,
-                                          format='svg',
-                                          encoding=encoding,
-                                          input_encoding=input_encoding,
-                                          expected_syntax_error='syntax error')
-
-
-def _test_pipe_lines_called_process_error(invalid_dot, *,
-                                          format, encoding, input_encoding,
-                                          expected_syntax_error):
+def test_pipe_called_process_error(invalid_dot, encoding='ascii',
+                                   input_encoding='utf-8'):
+    _test_pipe_called_process_error(invalid_dot,
+                                    format='svg',
+                                    encoding=encoding,
+                                    input_encoding=input_encoding,
+                                    expected_syntax_error='syntax error')
+
+
+def _test_pipe_called_process_error(invalid_dot, *,
+                                    format, encoding, input_encoding,
+                                    expected_syntax_error):
     assert encoding != input_encoding
 
     invalid_dot.encoding = input_encoding
@@ -297,10 +317,9 @@ def _test_pipe_lines_called_process_error(invalid_dot, *,
     assert expected_syntax_error in info.value.stderr
 
 
-def test_pipe_lines_called_process_error_mocked(invalid_dot,
-                                                mocker, mock_pipe_lines,
-                                                encoding='ascii',
-                                                input_encoding='utf-8'):
+def test_pipe_called_process_error_mocked(invalid_dot, mocker, mock_pipe,
+                                          encoding='ascii',
+                                          input_encoding='utf-8'):
     format = 'svg'
 
     expected_syntax_error = 'syntax error'
@@ -309,22 +328,21 @@ def test_pipe_lines_called_process_error_mocked(invalid_dot,
     fake_error = [1, _common.INVALID_CMD,
                   b'', expected_syntax_error.encode(input_encoding)]
     fake_error = graphviz.CalledProcessError(*fake_error)
-    mock_pipe_lines.side_effect = fake_error
+    mock_pipe.side_effect = fake_error
 
-    _test_pipe_lines_called_process_error(invalid_dot,
-                                          format=format,
-                                          encoding=encoding,
-                                          input_encoding=input_encoding,
-                                          expected_syntax_error=expected_syntax_error)
+    _test_pipe_called_process_error(invalid_dot,
+                                    format=format,
+                                    encoding=encoding,
+                                    input_encoding=input_encoding,
+                                    expected_syntax_error=expected_syntax_error)
 
-    mock_pipe_lines.assert_called_once_with(_common.EXPECTED_DEFAULT_ENGINE,
-                                            format,
-                                            mocker.ANY,
-                                            input_encoding=input_encoding,
-                                            quiet=False,
-                                            renderer=None,
-                                            formatter=None,
-                                            neato_no_op=None)
+    mock_pipe.assert_called_once_with(_common.EXPECTED_DEFAULT_ENGINE,
+                                      format,
+                                      mocker.ANY,
+                                      quiet=False,
+                                      renderer=None,
+                                      formatter=None,
+                                      neato_no_op=None)
 
 
 def test_repr_mimebundle_image_svg_xml_mocked(mocker, dot):
@@ -403,6 +421,17 @@ def test__view_unknown_platform(unknown_platform, dot):
         dot._view('name', format='png', quiet=False)
 
 
+def test__view_late_viewer_mocked(mocker, sentinel, unknown_platform, dot):
+    with pytest.raises(RuntimeError, match=r'support'):
+        dot._view(sentinel.name, format='png', quiet=False)
+
+    view = mocker.patch.object(dot, f'_view_{unknown_platform}', create=True)
+
+    assert dot._view(sentinel.name, format='png', quiet=False) is None
+
+    view.assert_called_once_with(sentinel.name, quiet=False)
+
+
 def test__view_mocked(mocker, sentinel, mock_platform, dot):
     _view_platform = mocker.patch.object(dot, f'_view_{mock_platform}',
                                          autospec=True)
@@ -412,3 +441,227 @@ def test__view_mocked(mocker, sentinel, mock_platform, dot):
     assert dot._view(sentinel.name, format='png', **kwargs) is None
 
     _view_platform.assert_called_once_with(sentinel.name, **kwargs)
+
+
+def test__view_format_mocked(mocker, sentinel, mock_platform, dot):
+    view_format = mocker.Mock()
+    subcls = type(type(dot).__name__, (type(dot),), {})
+    dot.__class__ = subcls
+    setattr(subcls, f'_view_png_{mock_platform}', view_format)  # after class creation
+
+    assert dot._view(sentinel.name, format='png', quiet=True) is None
+
+    view_format.assert_called_once_with(sentinel.name, quiet=True)
+
+
+@pytest.mark.parametrize(
+    'encoding', [None, 'ascii', 'utf-8'])
+def test_pipe_memoized_mocked(memoize, mock_pipe, mock_pipe_string, dot, encoding):
+    dot.encoding = 'utf-8'
+    if encoding == dot.encoding:
+        mock_pipe = mock_pipe_string
+
+    result = dot.pipe(encoding=encoding)
+
+    assert dot.pipe(encoding=encoding, quiet=True) is result
+    assert dot.copy().pipe(encoding=encoding) is result
+    mock_pipe.assert_called_once()
+
+    dot.pipe(format='svg', encoding=encoding)
+    assert mock_pipe.call_count == 2
+
+    dot.cache_clear()
+    assert not len(memoize)
+
+    assert dot.pipe(encoding=encoding) is result
+    assert mock_pipe.call_count == 3
+
+
+def test_render_memoized_mocked(tmp_path, mock_render, memoize, cls,
+                                filename='memoized.gv', expected=b'%PDF'):
+    dot = cls(*['graph { spam }'] if cls.__name__ == 'Source' else [],
+              filename=filename, directory=tmp_path)
+    rendered = tmp_path / f'{filename}.pdf'
+
+    def render(engine, format, filepath, **kwargs):
+        rendered.write_bytes(expected)
+        return str(rendered)
+
+    mock_render.side_effect = render
+
+    assert dot.render() == str(rendered)
+
+    assert dot.render(quiet=True) == str(rendered)
+    assert rendered.read_bytes() == expected
+    mock_render.assert_called_once()
+
+    with pytest.raises(graphviz.FileExistsError, match=r'output file exists'):
+        dot.render(raise_if_result_exists=True)
+
+    rendered.unlink()
+    assert dot.render() == str(rendered)
+    assert rendered.read_bytes() == expected
+    assert mock_render.call_count == 2
+
+    rendered.write_bytes(b'modified')
+    assert dot.render() == str(rendered)
+    assert rendered.read_bytes() == expected
+    assert mock_render.call_count == 3
+
+    assert len(graphviz._caching.RESULTS) == 1
+    (_, digest), = graphviz._caching.RESULTS._results.values()
+    assert digest == graphviz._caching.get_digest(expected)
+
+    dot.render(format='svg')
+    assert mock_render.call_count == 4
+
+
+def test_render_memoized_tmpdir_mocked(monkeypatch, tmp_path, mock_render, memoize, dot):
+    tmpdir = tmp_path / 'tmpfs'
+    tmpdir.mkdir()
+    monkeypatch.setenv('GRAPHVIZ_TMPDIR', str(tmpdir))
+    dot.directory = tmp_path / 'rendered'
+
+    def render(engine, format, filepath, *, outfile, **kwargs):
+        outfile.write_bytes(b'%PDF')
+        return str(outfile)
+
+    mock_render.side_effect = render
+
+    results = [dot.render(cleanup=True) for _ in range(3)]
+
+    assert results == [f'{dot.filepath}.pdf'] * 3
+    mock_render.assert_called_once()
+    assert len(graphviz._caching.RESULTS) == 1
+
+
+def test_render_batch_mocked(mocker, tmp_path, mock_render_batch, quiet, cls,
+                             batch_size=2):
+    args = ['graph { spam }'] if cls.__name__ == 'Source' else []
+    items = [cls(*args, filename=f'{name}.gv', directory=tmp_path / directory,
+                 engine=engine)
+             for name, directory, engine in [('spam', 'a', 'dot'),
+                                             ('eggs', 'b', 'dot'),
+                                             ('ham', 'a', 'neato'),
+                                             ('bacon', 'a', 'dot'),
+                                             ('lovely', 'a', 'dot')]]
+
+    mock_render_batch.side_effect = lambda engine, format, filepaths, **kwargs: [
+        f'{f}.{format}' for f in filepaths]
+
+    result = cls.render_batch(items, format='svg', quiet=quiet, batch_size=batch_size)
+
+    assert result == [f'{i.filepath}.svg' for i in items]
+    assert all(pathlib.Path(i.filepath).exists() for i in items)
+
+    kwargs = {'renderer': None, 'formatter': None, 'neato_no_op': None, 'quiet': quiet}
+    filepaths = [i.filepath for i in items]
+    assert mock_render_batch.call_args_list == [
+        mocker.call('dot', 'svg', (filepaths[0], filepaths[3]), **kwargs),
+        mocker.call('dot', 'svg', (filepaths[4],), **kwargs),
+        mocker.call('dot', 'svg', (filepaths[1],), **kwargs),
+        mocker.call('neato', 'svg', (filepaths[2],), **kwargs)]
+
+
+@pytest.mark.parametrize(
+    'encoding', [None, 'ascii'])
+def test_pipe_batch_mocked(mocker, mock_pipe_batch, quiet, cls, encoding,
+                           batch_size=2):
+    def make_item(comment, **kwargs):
+        if cls.__name__ == 'Source':
+            return cls(f'// {comment}\ngraph {{ spam }}', **kwargs)
+        return cls(comment=comment, **kwargs)
+
+    items = [make_item(f'item {i}', engine=engine, encoding=input_encoding)
+             for i, (engine, input_encoding) in enumerate([('dot', 'utf-8'),
+                                                           ('dot', 'latin1'),
+                                                           ('neato', 'utf-8'),
+                                                           ('dot', 'utf-8'),
+                                                           ('dot', 'utf-8')])]
+
+    mock_pipe_batch.side_effect = lambda engine, format, datas, **kwargs: [
+        d.rstrip().splitlines()[0] + b' ' + format.encode() for d in datas]
+
+    result = cls.pipe_batch(items, quiet=quiet, encoding=encoding,
+                            batch_size=batch_size)
+
+    expected = [f'// item {i} plain' for i in range(len(items))]
+    if encoding is None:
+        expected = [e.encode() for e in expected]
+    assert result == expected
+
+    kwargs = {'renderer': None, 'formatter': None, 'neato_no_op': None, 'quiet': quiet}
+    datas = [bytes(i) for i in items]
+    assert mock_pipe_batch.call_args_list == [
+        mocker.call('dot', 'plain', (datas[0], datas[3]), **kwargs),
+        mocker.call('dot', 'plain', (datas[4],), **kwargs),
+        mocker.call('dot', 'plain', (datas[1],), **kwargs),
+        mocker.call('neato', 'plain', (datas[2],), **kwargs)]
+
+
+def test_pipe_batch_invalid_batch_size(cls):
+    with pytest.raises(ValueError, match=r'batch_size must be positive'):
+        cls.pipe_batch([], batch_size=0)
+
+
+def test_render_batch_invalid_batch_size(cls):
+    with pytest.raises(ValueError, match=r'batch_size must be positive'):
+        cls.render_batch([], batch_size=0)
+
+
+@pytest.mark.parametrize(
+    'outfile', [None, 'spam.svg'])
+def test_render_cleanup_tmpdir_mocked(monkeypatch, tmp_path, mocker, mock_render,
+                                      dot, outfile):
+    tmpdir = tmp_path / 'tmpfs'
+    tmpdir.mkdir()
+    monkeypatch.setenv('GRAPHVIZ_TMPDIR', str(tmpdir))
+    dot.directory = tmp_path / 'rendered'
+    expected_filename = dot.filename
+    mock_save = mocker.patch.object(dot, 'save', autospec=True)
+
+    def render(engine, format, filepath, **kwargs):
+        assert pathlib.Path(filepath).parent == tmpdir
+        assert pathlib.Path(filepath).read_text(encoding=dot.encoding) == dot.source
+        return str(kwargs['outfile'])
+
+    mock_render.side_effect = render
+
+    result = dot.render(outfile=outfile, cleanup=True)
+
+    mock_save.assert_not_called()
+    expected_format = 'svg' if outfile is not None else dot.format
+    expected_outfile = (dot.directory / outfile if outfile is not None
+                        else pathlib.Path(f'{dot.filepath}.{expected_format}'))
+    mock_render.assert_called_once_with(dot.engine, expected_format, mocker.ANY,
+                                        renderer=None, formatter=None,
+                                        neato_no_op=None,
+                                        outfile=expected_outfile,
+                                        raise_if_result_exists=False,
+                                        overwrite_filepath=False,
+                                        quiet=False)
+    assert result == str(expected_outfile)
+    assert dot.filename == (dot.directory / 'spam.gv' if outfile is not None
+                            else expected_filename)
+    assert dot.directory.is_dir()
+    graphviz._cleanup.flush()
+    assert not list(tmpdir.iterdir()), 'transient source file removed'
+
+
+def test_render_cleanup_tmpdir_raises_mocked(monkeypatch, tmp_path, mock_render, dot):
+    monkeypatch.setenv('GRAPHVIZ_TMPDIR', str(tmp_path))
+    dot.directory = tmp_path / 'rendered'
+    mock_render.side_effect = graphviz.CalledProcessError(1, _common.INVALID_CMD)
+
+    with pytest.raises(graphviz.CalledProcessError):
+        dot.render(cleanup=True)
+
+    assert list(tmp_path.iterdir()) == [dot.directory], 'transient source file removed'
+
+
+@pytest.mark.parametrize(
+    'encoding', ['utf-8', 'UTF8', 'ascii', 'latin1'])
+def test_encoding_codec_info(dot, encoding):
+    dot.encoding = encoding
+    assert dot._codec_info is codecs.lookup(encoding)
+    assert dot.copy()._codec_info is dot._codec_info
@@ -0,0 +1,51 @@
+import pytest
+
+from graphviz import _caching
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [(None, 0), ('', 0), ('0', 0), ('-1', 0), ('42', 42)])
+def test_get_maxsize(value, expected):
+    environ = {_caching.ENV_MAXSIZE: value} if value is not None else {}
+    assert _caching.get_maxsize(environ) == expected
+
+
+def test_get_maxsize_invalid(caplog):
+    assert _caching.get_maxsize({_caching.ENV_MAXSIZE: 'spam'}) == _caching.DEFAULT_MAXSIZE
+
+    assert f'ignore invalid {_caching.ENV_MAXSIZE}' in caplog.text
+
+
+def test_get_digest():
+    digest = _caching.get_digest(b'graph { spam }')
+    assert len(digest) == _caching.DIGEST_SIZE
+    assert digest == _caching.get_digest(b'graph { spam }')
+    assert digest != _caching.get_digest(b'graph { eggs }')
+
+
+def test_make_key(digest=b'spam'):
+    key = _caching.make_key(digest, 'dot', 'svg', renderer=None, quiet=True)
+    assert key == _caching.make_key(digest, 'dot', 'svg', renderer=None)
+    assert key != _caching.make_key(b'eggs', 'dot', 'svg', renderer=None)
+    assert key != _caching.make_key(digest, 'dot', 'png', renderer=None)
+    assert key != _caching.make_key(digest, 'dot', 'svg', renderer='cairo')
+
+
+def test_result_cache(maxsize=2):
+    results = _caching.ResultCache(maxsize)
+    assert results.get('spam') is None
+
+    results.set('spam', b'spam')
+    results.set('eggs', b'eggs')
+    assert results.get('spam') == b'spam'
+
+    results.set('ham', b'ham')
+    assert len(results) == maxsize
+    assert results.get('eggs') is None, 'least recently used discarded'
+    assert results.get('spam') == b'spam'
+    assert results.get('ham') == b'ham'
+
+    results.clear()
+    assert not len(results)
+    assert results.get('spam') is None
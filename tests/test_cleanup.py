@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+import graphviz
+from graphviz import _cleanup
+
+
+def test_remove(tmp_path):
+    filepath = tmp_path / 'spam.gv'
+    filepath.write_text('graph { spam }\n')
+
+    _cleanup.remove(filepath)
+    _cleanup.wait(filepath)
+
+    assert not filepath.exists()
+
+
+def test_remove_missing(caplog, tmp_path):
+    _cleanup.remove(tmp_path / 'missing.gv')
+    _cleanup.flush()
+
+    assert 'cannot delete' in caplog.text
+
+
+def test_wait_unscheduled(tmp_path):
+    assert _cleanup.wait(tmp_path / 'unscheduled.gv') is None
+
+
+def test_save_waits_for_pending_remove(mocker, tmp_path):
+    dot = graphviz.Graph(filename='spam.gv', directory=tmp_path)
+    filepath = tmp_path / 'spam.gv'
+    filepath.write_text('stale\n')
+
+    started, release = threading.Event(), threading.Event()
+
+    def remove(filepath):
+        started.set()
+        release.wait()
+        filepath.unlink()
+
+    mocker.patch('os.remove', autospec=True, side_effect=remove)
+
+    _cleanup.remove(filepath)
+    started.wait()
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+
+    dot.save()
+    timer.join()
+
+    assert filepath.read_text(encoding=dot.encoding) == dot.source
+
+
+def test_remove_after_shutdown(monkeypatch, tmp_path):
+    executor = _cleanup._make_executor()
+    executor.shutdown()
+    monkeypatch.setattr(_cleanup, '_EXECUTOR', executor)
+    filepath = tmp_path / 'spam.gv'
+    filepath.write_text('graph { spam }\n')
+
+    assert _cleanup.remove(filepath) is None
+
+    assert not filepath.exists()
+    assert not _cleanup._PENDING
+
+
+def _render_cleanup_twice(directory):
+    dot = graphviz.Graph('child', directory=directory)
+    for _ in range(2):
+        dot.save()
+        _cleanup.remove(dot.filepath)
+    _cleanup.flush()
+    return os.path.exists(dot.filepath)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                    reason='requires fork start method')
+def test_remove_in_forked_child(mocker, tmp_path):
+    parent_pid = os.getpid()
+    release = threading.Event()
+
+    def remove(filepath, _remove=os.remove):
+        if os.getpid() == parent_pid:
+            release.wait()
+        _remove(filepath)
+
+    mocker.patch('os.remove', autospec=True, side_effect=remove)
+
+    pending = tmp_path / 'child.gv'
+    pending.write_text('graph { spam }\n')
+    _cleanup.remove(pending)  # pending in the parent at fork time
+
+    try:
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            result = pool.apply_async(_render_cleanup_twice, (tmp_path,))
+            assert result.get(timeout=10) is False
+    finally:
+        release.set()
+        _cleanup.flush()
+
+
+def test_reset_after_fork(monkeypatch):
+    monkeypatch.setattr(_cleanup, '_EXECUTOR', _cleanup._EXECUTOR)
+    monkeypatch.setattr(_cleanup, '_PENDING', {'spam': None})
+    monkeypatch.setattr(_cleanup, '_LOCK', _cleanup._LOCK)
+    executor = _cleanup._EXECUTOR
+
+    _cleanup._reset_after_fork()
+
+    assert _cleanup._EXECUTOR is not executor
+    assert _cleanup._PENDING == {}
@@ -35,26 +35,26 @@ def test_repr_image_svg_xml_encoding(input_encoding='latin1'):
 
 @pytest.mark.exe
 @pytest.mark.parametrize('input_encoding', ['utf-8', 'ascii', 'latin1'])
-def test_repr_image_svg_xml_encoding_mocked(mocker, mock_pipe_lines_string,
-                                            mock_pipe_lines, input_encoding):
+def test_repr_image_svg_xml_encoding_mocked(mocker, mock_pipe_string,
+                                            mock_pipe, input_encoding):
     dot = graphviz.Graph(encoding=input_encoding)
 
     result = dot._repr_image_svg_xml()
 
     if input_encoding == 'utf-8':
-        assert result is mock_pipe_lines_string.return_value
+        assert result is mock_pipe_string.return_value
 
-        mock_pipe_lines_string.assert_called_once()
-        mock_pipe_lines.assert_not_called()
+        mock_pipe_string.assert_called_once()
+        mock_pipe.assert_not_called()
 
-        assert (mock_pipe_lines_string.call_args.kwargs['encoding']
+        assert (mock_pipe_string.call_args.kwargs['encoding']
                 == EXPECTED_SVG_ENCODING)
     else:
-        assert result is mock_pipe_lines.return_value.decode.return_value
+        assert result is mock_pipe.return_value.decode.return_value
 
-        mock_pipe_lines.assert_called_once()
-        mock_pipe_lines_string.assert_not_called()
+        mock_pipe.assert_called_once()
+        mock_pipe_string.assert_not_called()
 
-        assert 'encoding' not in mock_pipe_lines.call_args.kwargs
-        (mock_pipe_lines.return_value.decode
+        assert 'encoding' not in mock_pipe.call_args.kwargs
+        (mock_pipe.return_value.decode
          .assert_called_once_with(EXPECTED_SVG_ENCODING))
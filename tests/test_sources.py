@@ -75,3 +75,32 @@ def test_source_iter(source):
     lines = list(source_without_newline)
 
     assert lines == list(source) * 2
+
+
+def test_source_digest(mocker, source):
+    source = source.copy()
+    mock_get_digest = mocker.patch('graphviz._caching.get_digest', autospec=True)
+
+    assert source._source_digest is mock_get_digest.return_value
+    assert source._source_digest is mock_get_digest.return_value
+    mock_get_digest.assert_called_once_with(source.source.encode(source.encoding))
+
+    source.encoding = 'ascii'
+    assert source._source_digest is mock_get_digest.return_value
+    assert mock_get_digest.call_count == 2
+
+
+def test_source_bytes():
+    source = graphviz.Source('graph { \N{LATIN SMALL LETTER A WITH DIAERESIS} }')
+
+    result = bytes(source)
+    assert result == 'graph { \N{LATIN SMALL LETTER A WITH DIAERESIS} }\n'.encode('utf-8')
+    assert bytes(source) is result
+
+    source.encoding = 'latin1'
+    assert bytes(source) == 'graph { \N{LATIN SMALL LETTER A WITH DIAERESIS} }\n'.encode('latin1')
+
+
+def test_source_digest_equal_sources(source):
+    assert source.copy()._source_digest == source._source_digest
+    assert graphviz.Source(source.source)._source_digest == source._source_digest
@@ -2,11 +2,12 @@
 
 """Update the ``help()`` outputs  in ``docs/api.rst``."""
 
-import contextlib
+import concurrent.futures
 import difflib
-import io
 import operator
+import os
 import pathlib
+import pydoc
 import re
 import sys
 import typing
@@ -19,31 +20,64 @@ ALL_CLASSES = [graphviz.Graph, graphviz.Digraph, graphviz.Source]
 
 ARGS_LINE = re.compile(r'(?:class | \| {2})\w+\(')
 
+ARGS_LINE_START = ('class ', ' |  ')
+
+ARGS_DELIMITER = re.compile(r'[][(),]')
+
 WRAP_AFTER = 80
 
 INDENT = ' ' * 4
 
 TARGET = pathlib.Path('docs/api.rst')
 
-PATTERN = (r'''
-           (
-           \ {{4}}>>>\ help\(graphviz\.{cls_name}\).*\n)
-           \ {{4}}Help\ on\ class\ {cls_name}
-                  \ in\ module\ graphviz\.(?:graphs|sources):\n
-           \ {{4}}<BLANKLINE>\n
-           (?:.*\n)+?
-           \ {{4}}<BLANKLINE>\n
-           ''')
+ANCHOR = INDENT + '>>> help(graphviz.{cls_name})'
+
+HEADER = (INDENT + 'Help on class {cls_name} in module graphviz.{module}:\n'
+          + INDENT + '<BLANKLINE>\n')
+
+HEADER_MODULES = ('graphs', 'sources')
+
+TERMINATOR = '\n' + INDENT + '<BLANKLINE>\n'
+
+SECTION_MARKERS = {cls.__name__: (ANCHOR.format(cls_name=cls.__name__),
+                                  tuple(HEADER.format(cls_name=cls.__name__, module=m)
+                                        for m in HEADER_MODULES))
+                   for cls in ALL_CLASSES}
 
 IO_KWARGS = {'encoding': 'utf-8'}
 
 
 def get_help(obj) -> str:
+    """Return post-processed help() output without touching sys.stdout."""
     print(f'capture help() output for {obj}')
-    with contextlib.redirect_stdout(io.StringIO()) as buf:
-        help(obj)
-    buf.seek(0)
-    return ''.join(iterlines(buf))
+    text = pydoc.render_doc(obj, title='Help on %s:', renderer=pydoc.plaintext)
+    text += '\n'  # like help() with a non-tty stdout
+    return ''.join(iterlines(text))
+
+
+def replace_help(target: str, *, cls_name: str, doc: str) -> typing.Tuple[str, bool]:
+    """Return (target, found) with the first help() output section of cls_name replaced by doc.
+
+    The section spans from the line after the ``>>> help(graphviz.<cls_name>)`` anchor
+    over its header to the (first non-header) ``<BLANKLINE>`` terminator line.
+    """
+    anchor, headers = SECTION_MARKERS[cls_name]
+
+    pos = target.find(anchor)
+    while pos != -1:
+        start = target.find('\n', pos + len(anchor)) + 1
+        if not start:
+            break
+
+        header = next((h for h in headers if target.startswith(h, start)), None)
+        if header is not None:
+            end = target.find(TERMINATOR, start + len(header))
+            if end != -1:
+                end += len(TERMINATOR)
+                return target[:start] + doc + target[end:], True
+
+        pos = target.find(anchor, pos + len(anchor))
+    return target, False
 
 
 def rpartition_initial(value: str, *, sep: str) -> typing.Tuple[str, str, str]:
@@ -60,7 +94,8 @@ def iterarguments(unwrapped_line: str) -> typing.Iterator[str]:
     """
     pos = 0
     bracket_level = paren_level = 0
-    for i, char in enumerate(unwrapped_line):
+    for match in ARGS_DELIMITER.finditer(unwrapped_line):
+        char = match.group()
         if char == '[':
             bracket_level += 1
         elif char == ']':
@@ -69,23 +104,23 @@ def iterarguments(unwrapped_line: str) -> typing.Iterator[str]:
             paren_level += 1
         elif char == ')':
             paren_level -= 1
-        elif (bracket_level == 0 and paren_level == 0 and char == ','
-              and unwrapped_line[i + 1: i + 3].strip() != '*'):
-            pos_including_comma = i + 1
+        elif (bracket_level == 0 and paren_level == 0
+              and unwrapped_line[match.end():match.end() + 2].strip() != '*'):
+            pos_including_comma = match.end()
             yield unwrapped_line[pos:pos_including_comma].lstrip()
             pos = pos_including_comma
     yield unwrapped_line[pos:].lstrip()
 
 
-def iterlines(stdout_lines, *,
+def iterlines(stdout_text: str, *,
               line_indent: str = INDENT,
               wrap_after: int = WRAP_AFTER) -> typing.Iterator[str]:
     """Yield post-processed help() stdout lines: rstrip, indent, wrap."""
-    for line in stdout_lines:
+    for line in stdout_text.splitlines(keepends=True):
         line = line.rstrip() + '\n'
-        line = line.replace("``'\\n'``", r"``'\\n'``")
 
-        if len(line) > wrap_after and ARGS_LINE.match(line):
+        if (len(line) > wrap_after
+                and line.startswith(ARGS_LINE_START) and ARGS_LINE.match(line)):
             indent = line_indent + ' ' * (line.index('(') + 1)
 
             *start, rest = line.partition('(')
@@ -102,35 +137,35 @@ def iterlines(stdout_lines, *,
 
 
 print('run', [SELF.name] + sys.argv[1:])
-help_docs = {cls.__name__: get_help(cls) for cls in ALL_CLASSES}
+with concurrent.futures.ThreadPoolExecutor(len(ALL_CLASSES)) as executor:
+    help_docs = dict(zip((cls.__name__ for cls in ALL_CLASSES),
+                         executor.map(get_help, ALL_CLASSES)))
 
 print('read', TARGET)
 target = target_before = TARGET.read_text(**IO_KWARGS)
 
 for cls_name, doc in help_docs.items():
-    print('replace', cls_name, 'PATTERN match')
-
-    pattern = re.compile(PATTERN.format(cls_name=cls_name), flags=re.VERBOSE)
+    print('replace', cls_name, 'help() section')
 
-    target, found = pattern.subn(fr'\1{doc}', target, count=1)
+    target, found = replace_help(target, cls_name=cls_name, doc=doc)
     assert found, f'replaced {cls_name} section'
 
-    target = target.replace(INDENT + '\n', INDENT + '<BLANKLINE>\n')
+target = target.replace(INDENT + '\n', INDENT + '<BLANKLINE>\n')
 
 if target == target_before:
     print(f'PASSED: unchanged {TARGET} (OK)')
     sys.exit(None)
 else:
     print('write', TARGET)
+    tmp = TARGET.with_name(f'{TARGET.name}.tmp')
+    tmp.write_bytes(target.encode(**IO_KWARGS))
+    os.replace(tmp, TARGET)
+
     splitlines = operator.methodcaller('splitlines', keepends=True)
     target_before, target = map(splitlines, (target_before, target))
     print(len(target_before), 'lines before')
     print(len(target), 'lines after')
 
-    with TARGET.open('w', **IO_KWARGS) as f:
-        for line in target:
-            f.write(line)
-
     for diff in difflib.context_diff(target_before, target):
         print(diff)
 